@@ -0,0 +1,104 @@
+# Splitting the scraped messages into Groq-sized chunks and checkpointing per-chunk results;
+# kept free of dp_updater's DB / Groq setup so it imports (and tests) on its own
+import collections
+import datetime
+import hashlib
+import json
+import re
+
+from job_parsing import json_loads
+
+# ----------------------------------------
+# CHUNK READER
+# ----------------------------------------
+def read_chunks(path, max_chars):
+    # Pack whole messages (one per line) greedily until the chunk would exceed max_chars (~4 chars per token),
+    # each under a "--- POST N ---" header so the model keeps posts apart in one combined prompt.
+    # Streams the file line by line (1 MiB read buffer) instead of loading it all with readlines().
+    with open(path, "r", encoding="utf-8", buffering=1 << 20) as f:
+        current = []
+        current_len = 0
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            
+            post = f"--- POST {len(current) + 1} ---\n{line}\n"
+            if current and current_len + len(post) > max_chars:
+                yield "".join(current)
+                current = []
+                current_len = 0
+                post = f"--- POST 1 ---\n{line}\n"
+            current.append(post)
+            current_len += len(post)
+    
+    if current:
+        yield "".join(current)
+
+POST_MARKER_RE = re.compile(r"^--- POST \d+ ---\n", re.M)
+
+def split_chunk(chunk):
+    # Halve a chunk by posts (renumbered from 1 like read_chunks does); [] for a single post
+    posts = [post for post in POST_MARKER_RE.split(chunk) if post]
+    if len(posts) < 2:
+        return []
+    
+    mid = len(posts) // 2
+    return [
+        "".join(f"--- POST {n} ---\n{post}" for n, post in enumerate(half, 1))
+        for half in (posts[:mid], posts[mid:])
+    ]
+
+# ----------------------------------------
+# CHECKPOINT
+# ----------------------------------------
+def chunk_id(chunk):
+    # Progress is keyed by content, so a changed input file cannot shift an unfinished chunk
+    # onto a finished one's mark
+    return hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
+def load_progress(progress_path):
+    try:
+        with open(progress_path, "r") as f:
+            return {line.strip() for line in f if line.strip()}
+    except OSError:
+        return set()
+
+def save_checkpoint(key, jobs, results_path, progress_path):
+    # Jobs first, then the progress mark: a crash in between only re-extracts (deduped on insert)
+    with open(results_path, "a", encoding="utf-8") as f:
+        f.writelines(json.dumps(job, ensure_ascii=False) + "\n" for job in jobs)
+    with open(progress_path, "a") as f:
+        f.write(f"{key}\n")
+
+def load_failures(failures_path):
+    failures = collections.Counter()
+    try:
+        with open(failures_path, "r") as f:
+            failures.update(line.strip() for line in f if line.strip())
+    except OSError:
+        pass
+    return failures
+
+def record_failure(key, failures_path):
+    with open(failures_path, "a") as f:
+        f.write(f"{key}\n")
+
+def reject_chunk(idx, chunk, reason, rejected_path):
+    # Set a chunk that fails the same way every run aside, so it cannot hold back the others
+    with open(rejected_path, "a", encoding="utf-8") as f:
+        f.write(f"=== {datetime.datetime.now():%Y-%m-%d %H:%M:%S} {reason}\n{chunk}")
+    print(f"❌ Chunk {idx+1}: giving up ({reason}), moved to {rejected_path}")
+
+def load_results(results_path):
+    jobs = []
+    try:
+        with open(results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    jobs.append(json_loads(line))
+                except ValueError:
+                    pass  # partial line from a crash mid-write
+    except OSError:
+        pass
+    return jobs
@@ -0,0 +1,157 @@
+# Pulling job JSON out of Groq output; kept free of dp_updater's DB / Groq setup so it imports (and tests) on its own
+try:
+    from orjson import loads as json_loads  # much faster on large LLM responses
+except ImportError:
+    from json import loads as json_loads
+
+# ----------------------------------------
+# STREAMING
+# ----------------------------------------
+# Keys that mark a dict as one job object rather than a wrapper or an unrelated aside
+JOB_FIELDS = ("company_name", "job_title", "apply_link")
+
+def is_job(value):
+    return isinstance(value, dict) and any(field in value for field in JOB_FIELDS)
+
+def is_jobs_payload(value):
+    # {"jobs": [...]} as the prompt asks, a bare list of job objects, or a single job object
+    if isinstance(value, dict):
+        return "jobs" in value or is_job(value)
+    return isinstance(value, list) and all(isinstance(v, dict) for v in value)
+
+async def read_stream(stream):
+    # Collect streamed deltas and hang up as soon as a complete top-level jobs payload has arrived.
+    # Returns (text, finish_reason): just that value, or the whole text if none was found;
+    # finish_reason "length" means the output was cut off at max_tokens
+    finish_reason = None
+    parts = []
+    length = 0
+    start = 0
+    depth = 0
+    in_string = False
+    escaped = False
+    async for part in stream:
+        if not part.choices:
+            continue
+        finish_reason = part.choices[0].finish_reason or finish_reason
+        delta = part.choices[0].delta.content or ""
+        
+        for i, c in enumerate(delta):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif c == "\\":
+                    escaped = True
+                elif c == '"':
+                    in_string = False
+            elif c == '"' and depth > 0:
+                in_string = True
+            elif c in "[{":
+                if depth == 0:
+                    start = length + i
+                depth += 1
+            elif c in "]}" and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    text = ("".join(parts) + delta[:i+1])[start:]
+                    try:
+                        value = json_loads(text)
+                    except ValueError:
+                        continue
+                    if not is_jobs_payload(value):
+                        continue  # e.g. a bracketed aside like "[2]" before the real JSON
+                    await stream.close()
+                    return text, finish_reason
+        
+        parts.append(delta)
+        length += len(delta)
+    
+    return "".join(parts), finish_reason
+
+# ----------------------------------------
+# JSON EXTRACTION
+# ----------------------------------------
+def find_json_array(raw):
+    # Single pass: return the first top-level [...] span, ignoring brackets inside JSON strings
+    depth = 0
+    start = None
+    in_string = False
+    escaped = False
+    for i, c in enumerate(raw):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"' and depth > 0:
+            in_string = True
+        elif c == "[":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif c == "]" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return raw[start:i+1]
+    return None
+
+def salvage_jobs(raw):
+    # Parse every job object ({...} directly inside the jobs array) on its own,
+    # so one malformed entry only loses itself instead of the whole chunk
+    jobs = []
+    stack = []  # (opening bracket, index)
+    in_string = False
+    escaped = False
+    for i, c in enumerate(raw):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"' and stack:
+            in_string = True
+        elif c in "[{":
+            stack.append((c, i))
+        elif c in "]}" and stack:
+            opener, start = stack.pop()
+            # [ {job} ] or { "jobs": [ {job} ] }
+            if opener == "{" and stack and stack[-1][0] == "[" and len(stack) <= 2:
+                try:
+                    job = json_loads(raw[start:i+1])
+                except ValueError:
+                    continue
+                if isinstance(job, dict):
+                    jobs.append(job)
+    return jobs
+
+def parse_jobs(raw):
+    # The prompt asks for {"jobs": [...]}; fall back to scanning for the array in free-form output,
+    # and finally to salvaging the individual job objects that are still valid
+    try:
+        data = json_loads(raw)
+    except ValueError:
+        array = find_json_array(raw)
+        try:
+            data = json_loads(array) if array is not None else None
+        except ValueError:
+            data = None
+        
+        if data is None:
+            data = salvage_jobs(raw)
+            if not data:
+                raise ValueError("no valid job objects in output")
+            print(f"⚠️ Salvaged {len(data)} job(s) from malformed JSON")
+    
+    if is_job(data) and "jobs" not in data:
+        data = [data]  # a lone job instead of {"jobs": [job]}
+    elif isinstance(data, dict):
+        if "jobs" not in data:
+            raise ValueError(f"no jobs key in object with keys {sorted(data)[:5]}")
+        data = data["jobs"]
+    if not isinstance(data, list):
+        raise ValueError(f"expected a jobs list, got {type(data).__name__}")
+    return [job for job in data if isinstance(job, dict)]
@@ -0,0 +1,67 @@
+# Normalizing extracted jobs into job_postings rows; kept free of dp_updater's DB / Groq setup
+# so it imports (and tests) on its own
+import json
+import random
+import re
+
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Column order of the staged row tuples handed to execute_values / COPY
+COLS = (
+    "logo_link", "job_title", "batch", "company_name", "location",
+    "qualification", "salary", "apply_link", "posted_date", "more_details",
+)
+
+def posted_offsets():
+    # ✅ Start at the current time (offset 0)
+    offset = 0
+    
+    while True:
+        # ✅ Add 5-10 minutes randomly to the previous job
+        offset += random.randint(5, 10)
+        
+        # ✅ Reset if time exceeds 24 hours from now
+        if offset > 24 * 60:
+            offset = 0
+            print("⏰ Time reset to current time (exceeded 24 hours)")
+        
+        yield offset
+
+# String(n) lengths of job_postings; longer model output is cut so one job cannot abort the insert
+COL_LIMITS = {
+    "logo_link": 1024, "job_title": 512, "batch": 128,
+    "location": 256, "salary": 128, "more_details": 5000,
+}
+
+def as_text(value, default=""):
+    # The model may send null, numbers, lists or objects for any field; every column is text
+    if isinstance(value, list):
+        value = ", ".join(str(v) for v in value if v not in (None, ""))
+    elif isinstance(value, dict):
+        value = json.dumps(value, ensure_ascii=False)
+    elif value is not None and not isinstance(value, str):
+        value = str(value)
+    return (value or default).replace("\x00", "")  # Postgres text cannot hold NUL
+
+def job_row(j, logos, posted_offset):
+    # Normalize one extracted job into a tuple in COLS order
+    apply_link = as_text(j.get("apply_link"))
+    company_name = as_text(j.get("company_name"))
+    
+    # Fix email links
+    if apply_link and not apply_link.startswith(("http", "mailto:")) and EMAIL_RE.match(apply_link):
+        apply_link = f"mailto:{apply_link}"
+    
+    row = {
+        "logo_link": logos.get(company_name, "") or as_text(j.get("logo_url")),  # fallback from AI
+        "job_title": as_text(j.get("job_title")),
+        "batch": as_text(j.get("batch"), "any"),
+        "company_name": company_name,
+        "location": as_text(j.get("location"), "Remote"),
+        "qualification": as_text(j.get("qualification"), "Any Graduate"),
+        "salary": as_text(j.get("salary"), "Not Disclosed"),
+        "apply_link": apply_link,
+        "posted_date": posted_offset,  # ✅ minutes after now, see POSTED_DATE_SQL in dp_updater
+        "more_details": as_text(j.get("more_details")),
+    }
+    return tuple(row[c][:COL_LIMITS[c]] if c in COL_LIMITS else row[c] for c in COLS)
@@ -1,9 +1,20 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from werkzeug.http import http_date
 import psycopg2
+import psycopg2.pool
 import os
+import time
+import datetime
+import threading
+import contextlib
 from dotenv import load_dotenv
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv("config.env")
 
 app = Flask(__name__)
@@ -18,11 +29,75 @@ CORS(app, resources={r"/*": {"origins": allowed_origins}})
 # ---- Database ----
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-def get_connection():
-    return psycopg2.connect(DATABASE_URL)
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "20"))
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", str(DB_POOL_MAX)))  # connections kept open between requests
+
+# Persistent connections shared by request threads instead of a new connect() per request.
+# psycopg2 closes any connection returned while DB_POOL_MIN are already idle, so only up to
+# DB_POOL_MIN survive a burst; lower it to trade reconnects for fewer open connections.
+# Created on first use, so the API still starts (and recovers) while the database is down.
+db_pool = None
+db_pool_lock = threading.Lock()
+
+# getconn() raises PoolError once DB_POOL_MAX connections are out; extra requests wait here instead
+db_pool_slots = threading.BoundedSemaphore(DB_POOL_MAX)
+
+def get_pool():
+    global db_pool
+    with db_pool_lock:
+        if db_pool is None:
+            db_pool = psycopg2.pool.ThreadedConnectionPool(DB_POOL_MIN, DB_POOL_MAX, DATABASE_URL)
+        return db_pool
+
+@contextlib.contextmanager
+def db_conn():
+    with db_pool_slots:
+        pool = get_pool()
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            pool.putconn(conn)  # the pool rolls back the open read transaction before reuse
 
 API_SECRET_KEY = os.getenv("API_SECRET_KEY")
 
+# ---- Total count cache ----
+# COUNT(*) scans the whole table; pagination only needs a recent total
+COUNT_TTL = 60  # seconds
+count_cache = {"total": None, "at": 0.0}
+
+def cached_total():
+    # None once the cached total is older than COUNT_TTL
+    if count_cache["total"] is not None and time.monotonic() - count_cache["at"] <= COUNT_TTL:
+        return count_cache["total"]
+    return None
+
+def store_total(total):
+    count_cache["total"] = total
+    count_cache["at"] = time.monotonic()
+
+def get_total_jobs(cur):
+    total = cached_total()
+    if total is None:
+        cur.execute("SELECT COUNT(*) FROM job_postings")
+        total = cur.fetchone()[0]
+        store_total(total)
+    return total
+
+# ---- JSON ----
+def json_default(o):
+    # Same datetime format jsonify produces, so clients see no difference
+    if isinstance(o, datetime.date):
+        return http_date(o)
+    raise TypeError(f"Type is not JSON serializable: {type(o).__name__}")
+
+def json_response(payload):
+    # orjson serializes the job pages several times faster than jsonify's stdlib json
+    if orjson is None:
+        return jsonify(payload)
+    body = orjson.dumps(payload, default=json_default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SORT_KEYS)
+    return Response(body, mimetype="application/json")
+
 # ---- API ----
 @app.get("/jobs")
 def get_jobs():
@@ -35,34 +110,64 @@ def get_jobs():
     limit = int(request.args.get("limit", 50))
     offset = (page - 1) * limit
 
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # 1. Execute the main job postings query
-    cur.execute("""
-        SELECT id, logo_link, job_title, batch, location,
-               qualification, salary, apply_link, posted_date, more_details, company_name
-        FROM job_postings
-        ORDER BY posted_date DESC
-        LIMIT %s OFFSET %s
-    """, (limit, offset))
-
-    rows = cur.fetchall()
-
-    # 2. <<< FIX IS HERE >>> Get column names *now* before the next query
-    cols = [desc[0] for desc in cur.description]
-    jobs = [dict(zip(cols, row)) for row in rows] # Map data with correct columns
-
-    # 3. Execute the total count query
-    cur.execute("SELECT COUNT(*) FROM job_postings")
-    total_jobs = cur.fetchone()[0]
-
-    cur.close()
-    conn.close()
-
-    return jsonify({
+    # Keyset pagination: ?after=<posted_date ISO>&after_id=<id> of the last job already shown.
+    # Seeks straight to the next page instead of scanning past OFFSET rows.
+    after = request.args.get("after")
+    if after:
+        try:
+            after = datetime.datetime.fromisoformat(after)
+            after_id = int(request.args["after_id"])
+        except (KeyError, ValueError):
+            return jsonify({"error": "after must be an ISO datetime and after_id an integer"}), 400
+        where, paging, params = "WHERE (posted_date, id) < (%s, %s)", "LIMIT %s", (after, after_id, limit)
+    else:
+        where, paging, params = "", "LIMIT %s OFFSET %s", (limit, offset)
+
+    # Stale total on an OFFSET page: count in the page query itself with a window function,
+    # saving the separate COUNT round trip (a keyset WHERE would count only the remaining rows)
+    total_jobs = cached_total()
+    with_count = total_jobs is None and not after
+    count_col = ", COUNT(*) OVER() AS total" if with_count else ""
+
+    with db_conn() as conn:
+        cur = conn.cursor()
+
+        # 1. Execute the main job postings query
+        cur.execute(f"""
+            SELECT id, logo_link, job_title, batch, location,
+                   qualification, salary, apply_link, posted_date, more_details, company_name{count_col}
+            FROM job_postings
+            {where}
+            ORDER BY posted_date DESC, id DESC
+            {paging}
+        """, params)
+
+        rows = cur.fetchall()
+
+        # 2. <<< FIX IS HERE >>> Get column names *now* before the next query
+        cols = [desc[0] for desc in cur.description]
+        jobs = [dict(zip(cols, row)) for row in rows] # Map data with correct columns
+
+        if with_count and jobs:
+            total_jobs = jobs[0]["total"]
+            for job in jobs:
+                del job["total"]
+            store_total(total_jobs)
+
+        # 3. Total count (cached for COUNT_TTL seconds; also covers a page past the end)
+        if total_jobs is None:
+            total_jobs = get_total_jobs(cur)
+
+        cur.close()
+
+    # Cursor for the next keyset page
+    last = jobs[-1] if jobs else None
+
+    return json_response({
         "page": page,
         "limit": limit,
         "total": total_jobs,
-        "jobs": jobs
+        "jobs": jobs,
+        "next_after": last["posted_date"].isoformat() if last else None,
+        "next_after_id": last["id"] if last else None
     })
@@ -1,5 +1,6 @@
 from telethon import TelegramClient
 from dotenv import load_dotenv
+import asyncio
 import os
 import subprocess
 import sys
@@ -11,68 +12,102 @@ load_dotenv("config.env")
 API_ID = int(os.getenv("API_ID"))
 API_HASH = os.getenv("API_HASH")
 TOTAL_GROUPS = int(os.getenv("TOTAL_GROUPS"))
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "5"))  # groups scraped at once
+
+OUTPUT_FILE = "scraped_data/all_messages.txt"
+WRITE_BATCH = 500  # messages buffered per group before each write
 
 client = TelegramClient("session_scraper", API_ID, API_HASH)
 
 
-async def scrape_group(group_id, group_key):
-    group_id = int(group_id)
-    group_name = f"group{group_key}"
-
-    # make groups folder
-    os.makedirs("groups", exist_ok=True)
-    os.makedirs("scraped_data", exist_ok=True)
+def last_id_path(group_key):
+    return f"groups/group{group_key}_last_id.txt"
 
-    last_id_file = f"groups/{group_name}_last_id.txt"
 
+def read_last_id(group_key):
     # read last ID if exists
-    if os.path.exists(last_id_file):
-        with open(last_id_file, "r") as f:
-            last_id = int(f.read().strip())
-    else:
-        last_id = None
+    path = last_id_path(group_key)
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            return int(f.read().strip())
+    return None
+
+
+async def scrape_group(group_id, group_key, last_id, out, write_lock):
+    group_id = int(group_id)
+    group_name = f"group{group_key}"
 
-    entity = await client.get_entity(group_id)
+    # Served from the session file's entity cache (persisted across runs); no GetChannels call
+    entity = await client.get_input_entity(group_id)
     print(f"\n📌 Scraping {group_name} ({group_id}) | last_id = {last_id}")
 
-    file_path = "scraped_data/all_messages.txt"
     new_last_id = last_id
+    lines = []
 
-    with open(file_path, "a", encoding="utf-8") as f:
+    # OLDEST → NEWEST **IMPORTANT**
+    async for msg in client.iter_messages(entity, reverse=True):
 
-        # OLDEST → NEWEST **IMPORTANT**
-        async for msg in client.iter_messages(entity, reverse=True):
+        if msg.id is None:
+            continue
 
-            if msg.id is None:
-                continue
+        # skip old messages
+        if last_id and msg.id <= last_id:
+            continue
 
-            # skip old messages
-            if last_id and msg.id <= last_id:
-                continue
+        text = (msg.text or "").replace("\n", " ").strip()
 
-            text = (msg.text or "").replace("\n", " ").strip()
+        if text:
+            lines.append(text)
 
-            if text:
-                f.write(text + "\n")
+            # groups run concurrently and share one output file
+            if len(lines) >= WRITE_BATCH:
+                async with write_lock:
+                    out.write("\n".join(lines) + "\n")
+                lines.clear()
 
-            new_last_id = msg.id  # update newest ID
+        new_last_id = msg.id  # update newest ID
 
-    # save new last_id
-    if new_last_id:
-        with open(last_id_file, "w") as f:
-            f.write(str(new_last_id))
+    if lines:
+        async with write_lock:
+            out.write("\n".join(lines) + "\n")
 
-    print(f"✔ Updated last_id for {group_name}: {new_last_id}")
+    print(f"✔ Scraped {group_name} up to id {new_last_id}")
+    return new_last_id
 
 
 async def main():
     await client.start()
     print("✔ Logged in\n")
 
-    for i in range(1, TOTAL_GROUPS + 1):
-        group_key = f"GROUP{i}"
-        group_id = os.getenv(group_key)
-        await scrape_group(group_id, i)
+    # make groups folder
+    os.makedirs("groups", exist_ok=True)
+    os.makedirs("scraped_data", exist_ok=True)
+
+    # all last IDs read once up front, written back once at the end
+    groups = range(1, TOTAL_GROUPS + 1)
+    last_ids = {i: read_last_id(i) for i in groups}
+
+    sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    write_lock = asyncio.Lock()
+
+    with open(OUTPUT_FILE, "a", encoding="utf-8", buffering=1 << 20) as out:
+
+        async def run(i):
+            async with sem:
+                group_key = f"GROUP{i}"
+                group_id = os.getenv(group_key)
+                return await scrape_group(group_id, i, last_ids[i], out, write_lock)
+
+        results = await asyncio.gather(*[run(i) for i in groups], return_exceptions=True)
+
+    # messages are on disk now (file closed), so last IDs can move past them
+    for i, result in zip(groups, results):
+        if isinstance(result, BaseException):  # includes CancelledError, which is not an Exception
+            print(f"❌ group{i} failed, last_id kept at {last_ids[i]}: {result}")
+        elif result and result != last_ids[i]:
+            with open(last_id_path(i), "w") as f:
+                f.write(str(result))
+            print(f"✔ Updated last_id for group{i}: {result}")
 
 with client:
     client.loop.run_until_complete(main())
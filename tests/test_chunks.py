@@ -0,0 +1,124 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chunks import (
+    chunk_id, load_failures, load_progress, load_results, read_chunks,
+    record_failure, reject_chunk, save_checkpoint, split_chunk,
+)
+
+
+class TempDirTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def write_messages(self, lines, mode="w"):
+        with open(self.path("messages.txt"), mode, encoding="utf-8") as f:
+            f.writelines(line + "\n" for line in lines)
+        return self.path("messages.txt")
+
+
+class ReadChunksTest(TempDirTest):
+    def test_numbers_posts_and_skips_blank_lines(self):
+        path = self.write_messages(["a", "", "  b  "])
+        self.assertEqual(list(read_chunks(path, 1000)), ["--- POST 1 ---\na\n--- POST 2 ---\nb\n"])
+
+    def test_max_chars_boundary(self):
+        post = "--- POST 1 ---\naaaa\n"  # 20 chars, and every header here is the same length
+        path = self.write_messages(["aaaa", "bbbb", "cccc"])
+
+        # Exactly two posts fit, the third starts a new chunk renumbered from 1
+        chunks = list(read_chunks(path, 2 * len(post)))
+        self.assertEqual(chunks, [
+            "--- POST 1 ---\naaaa\n--- POST 2 ---\nbbbb\n",
+            "--- POST 1 ---\ncccc\n",
+        ])
+
+        # One char less and every post is its own chunk
+        self.assertEqual(len(list(read_chunks(path, 2 * len(post) - 1))), 3)
+
+    def test_oversized_post_is_kept_whole(self):
+        path = self.write_messages(["x" * 50, "y"])
+        self.assertEqual(list(read_chunks(path, 10)), [
+            "--- POST 1 ---\n" + "x" * 50 + "\n",
+            "--- POST 1 ---\ny\n",
+        ])
+
+
+class SplitChunkTest(unittest.TestCase):
+    def test_halves_are_renumbered(self):
+        chunk = "".join(f"--- POST {n} ---\npost {n}\n" for n in range(1, 6))
+        self.assertEqual(split_chunk(chunk), [
+            "--- POST 1 ---\npost 1\n--- POST 2 ---\npost 2\n",
+            "--- POST 1 ---\npost 3\n--- POST 2 ---\npost 4\n--- POST 3 ---\npost 5\n",
+        ])
+
+    def test_marker_text_inside_a_post_is_not_a_boundary(self):
+        chunk = "--- POST 1 ---\nsee --- POST 9 --- below\n--- POST 2 ---\nb\n"
+        self.assertEqual(split_chunk(chunk), [
+            "--- POST 1 ---\nsee --- POST 9 --- below\n",
+            "--- POST 1 ---\nb\n",
+        ])
+
+    def test_single_post_cannot_be_split(self):
+        self.assertEqual(split_chunk("--- POST 1 ---\nonly\n"), [])
+
+
+class CheckpointTest(TempDirTest):
+    def test_round_trip(self):
+        results, progress = self.path("results.jsonl"), self.path("progress.txt")
+        save_checkpoint("k1", [{"job_title": "A", "salary": "₹ 5 LPA"}], results, progress)
+        save_checkpoint("k2", [], results, progress)
+
+        self.assertEqual(load_progress(progress), {"k1", "k2"})
+        self.assertEqual(load_results(results), [{"job_title": "A", "salary": "₹ 5 LPA"}])
+
+    def test_missing_files_mean_a_fresh_run(self):
+        self.assertEqual(load_progress(self.path("progress.txt")), set())
+        self.assertEqual(load_results(self.path("results.jsonl")), [])
+        self.assertEqual(load_failures(self.path("failures.txt")), {})
+
+    def test_partial_results_line_is_skipped(self):
+        results = self.path("results.jsonl")
+        with open(results, "w", encoding="utf-8") as f:
+            f.write('{"job_title": "A"}\n{"job_ti')
+        self.assertEqual(load_results(results), [{"job_title": "A"}])
+
+    def test_resume_after_append_is_keyed_by_content(self):
+        path = self.write_messages(["a" * 40, "b" * 40, "c" * 40])
+        first = list(read_chunks(path, 60))
+        progress = self.path("progress.txt")
+        for chunk in first[:2]:
+            save_checkpoint(chunk_id(chunk), [], self.path("results.jsonl"), progress)
+
+        # New messages arrive before the resumed run: finished chunks stay finished,
+        # the unfinished one and the new ones are pending
+        self.write_messages(["d" * 40], mode="a")
+        done = load_progress(progress)
+        pending = [chunk for chunk in read_chunks(path, 60) if chunk_id(chunk) not in done]
+        self.assertEqual(pending, [first[2], "--- POST 1 ---\n" + "d" * 40 + "\n"])
+
+    def test_failures_and_rejects(self):
+        failures_path, rejected = self.path("failures.txt"), self.path("rejected.txt")
+        record_failure("k1", failures_path)
+        record_failure("k1", failures_path)
+        record_failure("k2", failures_path)
+        self.assertEqual(load_failures(failures_path), {"k1": 2, "k2": 1})
+
+        with mock.patch("builtins.print"):
+            reject_chunk(0, "--- POST 1 ---\nx\n", "Groq 400", rejected)
+        with open(rejected, encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn("Groq 400\n--- POST 1 ---\nx\n", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_parsing import find_json_array, is_jobs_payload, parse_jobs, read_stream, salvage_jobs
+
+
+class FakeStream:
+    # Minimal stand-in for Groq's AsyncStream: yields one delta per text piece
+    def __init__(self, pieces, finish_reason="stop"):
+        self.pieces = pieces
+        self.finish_reason = finish_reason
+        self.closed = False
+        self.consumed = 0
+
+    def __aiter__(self):
+        return self.iterate()
+
+    async def iterate(self):
+        for i, piece in enumerate(self.pieces):
+            self.consumed += 1
+            finish_reason = self.finish_reason if i == len(self.pieces) - 1 else None
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece), finish_reason=finish_reason)])
+
+    async def close(self):
+        self.closed = True
+
+
+def read(pieces, finish_reason="stop"):
+    stream = FakeStream(pieces, finish_reason)
+    return asyncio.run(read_stream(stream)), stream
+
+
+class FindJsonArrayTest(unittest.TestCase):
+    def test_first_top_level_array(self):
+        self.assertEqual(find_json_array('Here: [{"a": 1}, [2]] and [3]'), '[{"a": 1}, [2]]')
+
+    def test_ignores_brackets_in_strings(self):
+        self.assertEqual(find_json_array('[{"t": "a ] b"}]'), '[{"t": "a ] b"}]')
+
+    def test_none_without_array(self):
+        self.assertIsNone(find_json_array("no json here"))
+
+
+class SalvageJobsTest(unittest.TestCase):
+    def test_keeps_valid_objects_around_a_broken_one(self):
+        raw = '{"jobs": [{"job_title": "A"}, {"job_title": "B" "x"}, {"job_title": "C"}'
+        self.assertEqual(salvage_jobs(raw), [{"job_title": "A"}, {"job_title": "C"}])
+
+    def test_skips_nested_objects(self):
+        raw = '[{"job_title": "A", "meta": {"k": 1}}, {"job_title": "B", ]'
+        self.assertEqual(salvage_jobs(raw), [{"job_title": "A", "meta": {"k": 1}}])
+
+
+class ParseJobsTest(unittest.TestCase):
+    def test_jobs_object(self):
+        self.assertEqual(parse_jobs('{"jobs": [{"job_title": "A"}]}'), [{"job_title": "A"}])
+
+    def test_array_in_free_text(self):
+        self.assertEqual(parse_jobs('Sure!\n[{"job_title": "A"}]\nDone.'), [{"job_title": "A"}])
+
+    def test_drops_non_dict_items(self):
+        self.assertEqual(parse_jobs('{"jobs": [{"job_title": "A"}, "B", 3, null]}'), [{"job_title": "A"}])
+
+    def test_non_list_jobs_is_an_error(self):
+        with self.assertRaises(ValueError):
+            parse_jobs('{"jobs": "none found"}')
+        with self.assertRaises(ValueError):
+            parse_jobs('42')
+
+    def test_single_job_object(self):
+        self.assertEqual(
+            parse_jobs('{"company_name": "X", "job_title": "Y"}'),
+            [{"company_name": "X", "job_title": "Y"}],
+        )
+
+    def test_object_without_jobs_is_an_error(self):
+        with self.assertRaises(ValueError):
+            parse_jobs("{}")
+        with self.assertRaises(ValueError):
+            parse_jobs('{"note": "no postings found"}')
+
+    def test_unparseable(self):
+        with self.assertRaises(ValueError):
+            parse_jobs("no json here")
+
+
+class ReadStreamTest(unittest.TestCase):
+    def test_stops_after_jobs_payload(self):
+        (text, _), stream = read(['{"jobs": [{"job_title"', ': "A"}]}', " trailing chatter"])
+        self.assertEqual(text, '{"jobs": [{"job_title": "A"}]}')
+        self.assertTrue(stream.closed)
+        self.assertEqual(stream.consumed, 2)
+
+    def test_skips_bracketed_aside(self):
+        (text, _), _ = read(["Found [2] posts: ", '[{"job_title": "A"}]'])
+        self.assertEqual(text, '[{"job_title": "A"}]')
+
+    def test_returns_whole_text_without_payload(self):
+        (text, finish_reason), stream = read(["no ", "json"])
+        self.assertEqual(text, "no json")
+        self.assertEqual(finish_reason, "stop")
+        self.assertFalse(stream.closed)
+
+    def test_reports_truncation(self):
+        (text, finish_reason), _ = read(['{"jobs": [{"job_title": "A"}, {"job_'], "length")
+        self.assertEqual(text, '{"jobs": [{"job_title": "A"}, {"job_')
+        self.assertEqual(finish_reason, "length")
+
+
+class IsJobsPayloadTest(unittest.TestCase):
+    def test_shapes(self):
+        self.assertTrue(is_jobs_payload({"jobs": []}))
+        self.assertTrue(is_jobs_payload([{"job_title": "A"}]))
+        self.assertTrue(is_jobs_payload({"company_name": "X", "job_title": "Y"}))
+        self.assertFalse(is_jobs_payload([2]))
+        self.assertFalse(is_jobs_payload({"note": "x"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import sys
+import unittest
+from itertools import islice
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_rows import COL_LIMITS, COLS, as_text, job_row, posted_offsets
+
+
+def row_dict(job, logos=None, offset=0):
+    return dict(zip(COLS, job_row(job, logos or {}, offset)))
+
+
+class AsTextTest(unittest.TestCase):
+    def test_values(self):
+        self.assertEqual(as_text(None, "any"), "any")
+        self.assertEqual(as_text("", "any"), "any")
+        self.assertEqual(as_text(2025), "2025")
+        self.assertEqual(as_text(["2024", None, 2025]), "2024, 2025")
+        self.assertEqual(as_text({"city": "Pune"}), '{"city": "Pune"}')
+        self.assertEqual(as_text("a\x00b"), "ab")
+
+
+class JobRowTest(unittest.TestCase):
+    def test_defaults_for_missing_and_null_fields(self):
+        row = row_dict({"job_title": "SDE", "salary": None}, offset=7)
+        self.assertEqual(row["job_title"], "SDE")
+        self.assertEqual(row["batch"], "any")
+        self.assertEqual(row["location"], "Remote")
+        self.assertEqual(row["qualification"], "Any Graduate")
+        self.assertEqual(row["salary"], "Not Disclosed")
+        self.assertEqual(row["posted_date"], 7)
+
+    def test_fields_are_text_and_fit_their_columns(self):
+        row = row_dict({
+            "job_title": "t" * 600,
+            "batch": ["2024", "2025"],
+            "salary": "9" * 300,
+            "location": {"city": "Pune"},
+            "more_details": "d" * 6000,
+        })
+        self.assertEqual(row["batch"], "2024, 2025")
+        self.assertEqual(row["location"], '{"city": "Pune"}')
+        for col, limit in COL_LIMITS.items():
+            self.assertLessEqual(len(row[col]), limit, col)
+        self.assertEqual(len(row["job_title"]), 512)
+
+    def test_email_apply_link(self):
+        self.assertEqual(row_dict({"apply_link": "hr@acme.io"})["apply_link"], "mailto:hr@acme.io")
+        self.assertEqual(row_dict({"apply_link": "mailto:hr@acme.io"})["apply_link"], "mailto:hr@acme.io")
+        self.assertEqual(row_dict({"apply_link": "https://x.io/?ref=a@b.c"})["apply_link"], "https://x.io/?ref=a@b.c")
+
+    def test_logo_from_lookup_then_model(self):
+        self.assertEqual(row_dict({"company_name": "Acme", "logo_url": "m"}, {"Acme": "l"})["logo_link"], "l")
+        self.assertEqual(row_dict({"company_name": "Acme", "logo_url": "m"}, {"Acme": ""})["logo_link"], "m")
+
+
+class PostedOffsetsTest(unittest.TestCase):
+    def test_steps_of_five_to_ten_minutes(self):
+        offsets = list(islice(posted_offsets(), 100))
+        steps = [b - a for a, b in zip([0] + offsets, offsets)]
+        self.assertTrue(all(5 <= step <= 10 for step in steps))
+
+    def test_resets_after_a_day(self):
+        with mock.patch("job_rows.random.randint", return_value=10), mock.patch("builtins.print"):
+            offsets = list(islice(posted_offsets(), 146))
+        self.assertEqual(offsets[143], 1440)
+        self.assertEqual(offsets[144], 0)
+        self.assertEqual(offsets[145], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()